@@ -336,7 +336,7 @@ class FairDataInput(object):
     def _gen_pert(self, count, **kwargs):
         """Checks parameters, creates BetaPert, returns random values"""
         self._check_pert(**kwargs)
-        pert = FairBetaPert(**kwargs)
+        pert = FairBetaPert.get(**kwargs)
         rvs = pert.random_variates(count)
         return rvs
 
@@ -1,8 +1,16 @@
 """This contains a subclass for curves used in reporting"""
 
+import itertools
+
+from ..model.model import FairModel
+from ..model.meta_model import FairMetaModel
 from ..utility.fair_exception import FairException
 
 
+# Types accepted by _input_check()
+_MODEL_TYPES = (FairModel, FairMetaModel)
+
+
 class FairBaseCurve(object):
     """Base class useful only for the ._input_check() method
 
@@ -25,23 +33,24 @@ class FairBaseCurve(object):
 
         """
         # If it's a model or metamodel, plug it in a dict.
-        rv = {}
-        if value.__class__.__name__ in ['FairModel', 'FairMetaModel']:
-            rv[value.get_name()] = value
-            return rv
+        if isinstance(value, _MODEL_TYPES):
+            return {value.get_name(): value}
         # Check for iterable. If not, raise error.
-        if not hasattr(value, '__iter__'):
+        try:
+            iterator = iter(value)
+        except TypeError:
             raise FairException('Input is not a FairModel, FairMetaModel, or an iterable.')
         # Make sure not an empty iterable
-        else:
-            if len(value) == 0:
-                raise FairException('Input is an empty iterable.')
-        # Iterate and process remainder.
-        for proported_model in value:
-            if proported_model.__class__.__name__ in ['FairModel', 'FairMetaModel']:
-                rv[proported_model.get_name()] = proported_model
-            else:
+        try:
+            first = next(iterator)
+        except StopIteration:
+            raise FairException('Input is an empty iterable.')
+        # Iterate and process remainder in a single pass.
+        rv = {}
+        for proported_model in itertools.chain([first], iterator):
+            if not isinstance(proported_model, _MODEL_TYPES):
                 raise FairException('Iterable member is not a FairModel or FairMetaModel')
+            rv[proported_model.get_name()] = proported_model
         return rv
 
     def generate_image(self):
@@ -1,2 +1,6 @@
-from .beta_pert import FairBetaPert
+from .beta_pert import (
+    FairBetaPert,
+    FairBetaPertArray,
+    FairBetaPertBatchSampler,
+)
 from .fair_exception import FairException
@@ -0,0 +1,148 @@
+"""Numba kernels for using BetaPERT distributions inside jitted code
+
+This module requires numba and is imported optionally by callers. The
+special functions are bound to scipy's Cython implementations through
+ctypes, so scipy.stats objects never need to cross into jitted code.
+
+"""
+
+import ctypes
+
+import numpy as np
+
+from numba import njit
+from numba.extending import get_cython_function_address
+
+from . import beta_pert
+
+
+def _get_special(names, n_args):
+    """Get a ctypes wrapper for a double-typed scipy cython_special function
+
+    Fused functions are exported under a mangled name (index 0 being the
+    double variant), so several names may be supplied in order of
+    preference. The trailing int argument is Cython's skip_dispatch flag.
+
+    """
+    for name in names:
+        try:
+            address = get_cython_function_address(
+                'scipy.special.cython_special',
+                name
+            )
+        except ValueError:
+            continue
+        argtypes = (ctypes.c_double,) * n_args + (ctypes.c_int,)
+        return ctypes.CFUNCTYPE(ctypes.c_double, *argtypes)(address)
+    raise ImportError('scipy.special.cython_special lacks {}'.format(names))
+
+
+_betaincinv = _get_special(['__pyx_fuse_0betaincinv', 'betaincinv'], 3)
+_betaln = _get_special(['betaln'], 2)
+
+
+# Compile the one shape calculation shared with FairBetaPert
+_pert_shape = njit(cache=True)(beta_pert._pert_shape)
+
+
+@njit(cache=True, fastmath=True)
+def pert_rvs(low, mode, high, gamma, count, out):
+    """Fill `out` with `count` PERT-distributed random variates
+
+    The parameterization is identical to FairBetaPert. Because this is a
+    compiled function it can be called from other njit functions without
+    an object mode round trip.
+
+    Parameters
+    ----------
+    low : float
+        Lower bound for the distribution
+    mode : float
+        The most common value in the distribution
+    high : float
+        Upper bound for the distribution
+    gamma : float
+        A BetaPERT parameter for narrowing peak
+    count : int
+        The number of random variates to create
+    out : np.array
+        A float64 array of at least size `count` to be filled
+
+    Returns
+    -------
+    np.array
+        The `out` array
+
+    .. note:: Numba keeps its own random state, which is seeded by calling
+              np.random.seed() from within jitted code.
+
+    """
+    value_range = high - low
+    alpha, beta = _pert_shape(low, mode, high, gamma)
+    for i in range(count):
+        out[i] = low + value_range * np.random.beta(alpha, beta)
+    return out
+
+
+# Functions calling ctypes pointers cannot be cached by numba
+@njit
+def pert_pdf(x, low, mode, high, gamma):
+    """Get the probability density of a PERT distribution at `x`
+
+    Parameters
+    ----------
+    x : float
+        The value at which to evaluate the density
+    low : float
+        Lower bound for the distribution
+    mode : float
+        The most common value in the distribution
+    high : float
+        Upper bound for the distribution
+    gamma : float
+        A BetaPERT parameter for narrowing peak
+
+    Returns
+    -------
+    float
+        The density at `x`, which is zero outside of [low, high]
+
+    """
+    value_range = high - low
+    z = (x - low) / value_range
+    if z < 0 or z > 1:
+        return 0.0
+    alpha, beta = _pert_shape(low, mode, high, gamma)
+    log_density = (
+        (alpha - 1) * np.log(z)
+        + (beta - 1) * np.log1p(-z)
+        - _betaln(alpha, beta, 0)
+    )
+    return np.exp(log_density) / value_range
+
+
+@njit
+def pert_ppf(u, low, mode, high, gamma):
+    """Get the value of a PERT distribution at quantile `u`
+
+    Parameters
+    ----------
+    u : float
+        A quantile between 0 and 1
+    low : float
+        Lower bound for the distribution
+    mode : float
+        The most common value in the distribution
+    high : float
+        Upper bound for the distribution
+    gamma : float
+        A BetaPERT parameter for narrowing peak
+
+    Returns
+    -------
+    float
+        The value of the distribution at quantile `u`
+
+    """
+    alpha, beta = _pert_shape(low, mode, high, gamma)
+    return low + (high - low) * _betaincinv(alpha, beta, u, 0)
@@ -38,7 +38,7 @@ setup(
     ],
     requires=[
         'pandas',
-        'numpy',
+        'numpy (>=1.17.0)',
         'scipy',
         'matplotlib',
         'xlrd',
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from pyfair.model.model_input import FairDataInput
 from pyfair.utility.fair_exception import FairException
 
@@ -92,6 +94,10 @@ class TestFairModelInput(unittest.TestCase):
         result = self._input.generate('Probability of Action', self._COUNT, mean=.5, stdev=2)
         self.assertTrue(max(result) <= 1)
         self.assertTrue(min(result) >= 0)
+        # Unhashable PERT parameters bypass the construction cache
+        for low in [np.array(1.0), np.array([1.0])]:
+            result = self._input.generate('Loss Event Frequency', self._COUNT, low=low, mode=5, high=10)
+            self.assertTrue(len(result) == self._COUNT)
     
     def test_check_generation_multi(self):
         """Multi was such a terrible idea"""
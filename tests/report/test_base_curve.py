@@ -22,6 +22,9 @@ class TestFairBaseCurve(unittest.TestCase):
         good_list = [model, meta, model]
         for input_item in [model, meta, good_list]:
             self._fbc._input_check(input_item)
+        # Generators are consumed without being materialized first
+        rv = self._fbc._input_check(item for item in good_list)
+        self.assertEqual(set(rv.keys()), {'model', 'meta'})
 
     def test_bad_inputs(self):
         """Test base_curve for bad inputs."""
@@ -29,7 +32,9 @@ class TestFairBaseCurve(unittest.TestCase):
         bad_input_1 = []
         bad_input_2 = [model, 'a', 1]
         bad_input_3 = 'abc'
-        bad_list = [bad_input_1, bad_input_2, bad_input_3]
+        bad_input_4 = 1
+        bad_input_5 = iter([])
+        bad_list = [bad_input_1, bad_input_2, bad_input_3, bad_input_4, bad_input_5]
         for input_item in bad_list:
             self.assertRaises(
                 FairException, 
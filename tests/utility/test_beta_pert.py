@@ -1,8 +1,12 @@
+import importlib.util
 import unittest
 
 import numpy as np
 
-from pyfair.utility.beta_pert import FairBetaPert
+from pyfair.utility.beta_pert import (
+    FairBetaPert,
+    FairBetaPertBatchSampler,
+)
 from pyfair.utility.fair_exception import FairException
 
 
@@ -24,7 +28,7 @@ class TestFairViolinPlot(unittest.TestCase):
         )
         variates = fbp.random_variates(1_000)
         mean = variates.mean()
-        self.assertEquals(mean, self._CORRECT_MEAN)
+        self.assertAlmostEqual(mean, self._CORRECT_MEAN, places=10)
         # Test incorrect usage
         self.assertRaises(
             FairException,
@@ -34,6 +38,157 @@ class TestFairViolinPlot(unittest.TestCase):
             high=5
         )
 
+    def test_seed(self):
+        """Test seeded BetaPert generation is reproducible"""
+        fbp_1 = FairBetaPert(low=5, mode=20, high=50, seed=42)
+        fbp_2 = FairBetaPert(low=5, mode=20, high=50, seed=42)
+        variates_1 = fbp_1.random_variates(1_000)
+        variates_2 = fbp_2.random_variates(1_000)
+        self.assertTrue(np.array_equal(variates_1, variates_2))
+        self.assertTrue(variates_1.min() >= 5)
+        self.assertTrue(variates_1.max() <= 50)
+
+    def test_slots(self):
+        """Test BetaPert instances carry no __dict__"""
+        fbp = FairBetaPert(low=5, mode=20, high=50)
+        self.assertFalse(hasattr(fbp, '__dict__'))
+        self.assertRaises(AttributeError, setattr, fbp, '_other', 1)
+
+    def test_beta_curve(self):
+        """Test lazily-built scipy curve matches the parameters"""
+        fbp = FairBetaPert(low=5, mode=20, high=50, gamma=2)
+        self.assertIsNone(fbp._frozen_curve)
+        curve = fbp._beta_curve
+        self.assertEqual(curve.support(), (5, 50))
+        self.assertEqual(curve.args[:2], (fbp._alpha, fbp._beta))
+        self.assertIs(fbp._beta_curve, curve)
+
+    def test_dtype(self):
+        """Test BetaPert generation at reduced precision"""
+        fbp = FairBetaPert(low=5, mode=20, high=50, gamma=2)
+        variates = fbp.random_variates(1_000, dtype=np.float32)
+        self.assertEqual(variates.dtype, np.float32)
+        self.assertTrue(variates.min() >= 5)
+        self.assertTrue(variates.max() <= 50)
+        # Other types would truncate the draws or overflow
+        for dtype in [int, np.int32, bool, np.float16]:
+            self.assertRaises(
+                FairException,
+                fbp.random_variates,
+                10,
+                dtype=dtype,
+            )
+
+    def test_spawn(self):
+        """Test spawning independent BetaPerts"""
+        for seed in [42, None]:
+            np.random.seed(42)
+            children_1 = FairBetaPert(5, 20, 50, seed=seed).spawn(2)
+            np.random.seed(42)
+            children_2 = FairBetaPert(5, 20, 50, seed=seed).spawn(2)
+            variates = [child.random_variates(100) for child in children_1]
+            repeated = [child.random_variates(100) for child in children_2]
+            self.assertEqual(len(children_1), 2)
+            self.assertFalse(np.array_equal(variates[0], variates[1]))
+            self.assertTrue(np.array_equal(variates[0], repeated[0]))
+            self.assertTrue(np.array_equal(variates[1], repeated[1]))
+
+    def test_ppf(self):
+        """Test BetaPert inverse CDF"""
+        fbp = FairBetaPert(low=5, mode=20, high=50, gamma=2)
+        quantiles = np.linspace(0, 1, 11)
+        self.assertTrue(np.allclose(
+            fbp.ppf(quantiles),
+            fbp._beta_curve.ppf(quantiles)
+        ))
+
+    def test_get(self):
+        """Test cached BetaPert retrieval"""
+        fbp_1 = FairBetaPert.get(low=5, mode=20, high=50, gamma=2)
+        fbp_2 = FairBetaPert.get(low=5, mode=20, high=50, gamma=2)
+        fbp_3 = FairBetaPert.get(low=5, mode=25, high=50, gamma=2)
+        self.assertIs(fbp_1, fbp_2)
+        self.assertIsNot(fbp_1, fbp_3)
+        self.assertRaises(FairException, FairBetaPert.get, 5, 5, 5)
+
+    def test_from_arrays(self):
+        """Test vectorized BetaPert generation"""
+        lows = np.array([5, 0, 100])
+        modes = np.array([20, 1, 150])
+        highs = np.array([50, 2, 300])
+        fbpa = FairBetaPert.from_arrays(lows, modes, highs, gamma=2)
+        variates = fbpa.random_variates(1_000)
+        self.assertEqual(variates.shape, (3, 1_000))
+        self.assertTrue(np.all(variates.min(axis=1) >= lows))
+        self.assertTrue(np.all(variates.max(axis=1) <= highs))
+        # Shape parameters match the scalar class
+        fbp = FairBetaPert(low=5, mode=20, high=50, gamma=2)
+        self.assertAlmostEqual(fbpa._alpha[0], fbp._alpha)
+        self.assertAlmostEqual(fbpa._beta[0], fbp._beta)
+        # Test incorrect usage
+        self.assertRaises(
+            FairException,
+            FairBetaPert.from_arrays,
+            lows,
+            modes,
+            np.array([50, 0, 300]),
+        )
+        self.assertRaises(
+            FairException,
+            FairBetaPert.from_arrays,
+            lows,
+            modes,
+            highs[:2],
+        )
+        self.assertRaises(FairException, FairBetaPert.from_arrays, 5, 20, 50)
+        self.assertRaises(
+            FairException,
+            FairBetaPert.from_arrays,
+            lows[None, :],
+            modes[None, :],
+            highs[None, :],
+        )
+
+    def test_batch_sampler(self):
+        """Test batched BetaPert generation"""
+        fbp = FairBetaPert(low=5, mode=20, high=50, gamma=2)
+        sampler_1 = FairBetaPertBatchSampler(2_000, seed=42)
+        sampler_2 = FairBetaPertBatchSampler(2_000, seed=42)
+        first, second = sampler_1.sample([fbp, fbp], 1_000)
+        self.assertEqual(len(first), 1_000)
+        self.assertTrue(first.min() >= 5)
+        self.assertTrue(first.max() <= 50)
+        self.assertFalse(np.array_equal(first, second))
+        # Equal seeds give common random numbers
+        self.assertTrue(np.array_equal(first, sampler_2.draw(fbp, 1_000)))
+        self.assertTrue(np.allclose(first, fbp.ppf(sampler_2._uniforms[:1_000])))
+        # Pool is exhausted and direct sampling is unaffected
+        self.assertRaises(FairException, sampler_1.draw, fbp, 1)
+        self.assertEqual(len(fbp.random_variates(10)), 10)
+
+    @unittest.skipUnless(importlib.util.find_spec('numba'), 'numba required')
+    def test_numba_kernel(self):
+        """Test jitted BetaPert kernel"""
+        from pyfair.utility._beta_pert_nb import pert_rvs
+        out = np.empty(1_000)
+        pert_rvs(5.0, 20.0, 50.0, 2.0, 1_000, out)
+        self.assertTrue(out.min() >= 5)
+        self.assertTrue(out.max() <= 50)
+
+    @unittest.skipUnless(importlib.util.find_spec('numba'), 'numba required')
+    def test_numba_pdf_ppf(self):
+        """Test jitted BetaPert density and inverse CDF"""
+        from pyfair.utility._beta_pert_nb import pert_pdf, pert_ppf
+        fbp = FairBetaPert(low=5, mode=20, high=50, gamma=2)
+        for u in [0.1, 0.5, 0.9]:
+            self.assertAlmostEqual(pert_ppf(u, 5.0, 20.0, 50.0, 2.0), fbp.ppf(u))
+        for x in [10.0, 20.0, 40.0]:
+            self.assertAlmostEqual(
+                pert_pdf(x, 5.0, 20.0, 50.0, 2.0),
+                fbp._beta_curve.pdf(x)
+            )
+        self.assertEqual(pert_pdf(60.0, 5.0, 20.0, 50.0, 2.0), 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()